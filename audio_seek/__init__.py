@@ -1,6 +1,7 @@
 from ._audio_seek import BITS_TYPE, AudioSeek
 from .ensure_mono import ensure_mono
 from .read_audio_segment import read_audio_segment
+from .resample import resample
 
 __version__ = "0.1.0"
 
@@ -9,4 +10,5 @@ __all__ = [
     "AudioSeek",
     "ensure_mono",
     "read_audio_segment",
+    "resample",
 ]
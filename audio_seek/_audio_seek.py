@@ -1,12 +1,18 @@
+import functools
 import os
 import tempfile
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, TypeAlias, TypedDict
+from typing import Iterable, Literal, TypeAlias, TypedDict
 
 import numpy as np
 import soundfile as sf
 
+from audio_seek.ensure_mono import ensure_mono
+from audio_seek.read_audio_segment import read_audio_segment
+from audio_seek.resample import resample
+
 BITS_TYPE: TypeAlias = Literal[2, 3, 4, 5]
 
 
@@ -18,9 +24,28 @@ class SubtypeInfo(TypedDict):
     bits_per_sample: int
 
 
-# Runtime cache: stores the best seekable subtype for each bit depth
+# Metadata of the best seekable subtype resolved for each bit depth
+# (resolution is memoized by _resolve_best_subtype_impl's lru_cache)
 SUBTYPE_CACHE: dict[BITS_TYPE, SubtypeInfo] = {}
 
+# Priority candidates for each bit depth
+# Priority: Standard G.726 -> Known seekable formats
+CANDIDATES_BY_BITS: dict[int, tuple[str, ...]] = {
+    2: ("G726_16", "NMS_ADPCM_16"),
+    3: ("G726_24", "NMS_ADPCM_24"),
+    4: ("G726_32", "G721_32", "IMA_ADPCM", "MS_ADPCM", "NMS_ADPCM_32"),
+    5: ("G726_40", "NMS_ADPCM_40"),
+}
+
+# Standard fallback formats (widely supported and seekable)
+FALLBACK_CANDIDATES: tuple[str, ...] = ("IMA_ADPCM", "MS_ADPCM")
+
+# Frames handed to libsndfile per write call when streaming to disk
+WRITE_BLOCK_FRAMES = 65536
+
+# WAV subtypes supported by the linked libsndfile, queried once on first use
+_AVAILABLE_WAV_SUBTYPES: frozenset[str] | None = None
+
 
 class AudioSeek:
     """
@@ -34,23 +59,32 @@ class AudioSeek:
         Gets audio file total duration (seconds).
         Advantage: Only reads header, doesn't load audio data, extremely fast (O(1)).
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
         # SoundFile object only parses Header when opened
-        with sf.SoundFile(file_path) as f:
-            # frames = total samples, samplerate = sampling rate
-            return f.frames / f.samplerate
+        # (sf.info() opens the same SoundFile and also reads format strings)
+        try:
+            with sf.SoundFile(file_path) as f:
+                # frames = total samples, samplerate = sampling rate
+                return f.frames / f.samplerate
+
+        # Only stat on failure, keeps the happy path to a single open()
+        except sf.LibsndfileError as e:
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}") from e
+            raise
 
     @staticmethod
     def read_segment(
         file_path: Path | str,
         start_sec: float,
         duration_sec: float,
+        *,
+        cached: bool = False,
     ) -> np.ndarray:
-        from audio_seek.read_audio_segment import read_audio_segment
-
-        return read_audio_segment(file_path, start_sec, duration_sec)
+        """
+        Reads audio segment as float32.
+        Set cached=True for repeated seeks into the same files.
+        """
+        return read_audio_segment(file_path, start_sec, duration_sec, cached=cached)
 
     @staticmethod
     def read_segment_to_file(
@@ -63,8 +97,6 @@ class AudioSeek:
         Reads audio segment and saves to PCM WAV (16-bit).
         For compressed formats, use read_segment() + write() instead.
         """
-        from audio_seek.read_audio_segment import read_audio_segment
-
         # Read audio segment data
         data = read_audio_segment(file_path, start_sec, duration_sec)
 
@@ -96,18 +128,45 @@ class AudioSeek:
                                    2 bits @ 16k = 32kbps (recommended)
                                    3 bits @ 16k = 48kbps
         """
-
-        # 1. Check if compression depth is valid
-        subtype = AudioSeek.resolve_best_subtype(bits_per_sample)
-        if not subtype:
-            raise ValueError(
-                f"Unsupported bits_per_sample: {bits_per_sample}. "
-                + f"Please choose one of: {list(SUBTYPE_CACHE.keys())}"
+        # Common case (float32 mono, 16 kHz, 2 bits): specialized path
+        if (
+            bits_per_sample == 2
+            and sample_rate == 16000
+            and data.ndim == 1
+            and data.dtype == np.float32
+            and data.flags.c_contiguous
+        ):
+            # Already validated: go straight to the fixed-argument stream
+            AudioSeek._write_blocks(
+                file_path, data, 16000, 1, _resolve_best_subtype_impl(2)
             )
+            return Path(file_path)
+
+        # 1. Resolve seekable subtype (falls back with a warning, never empty)
+        subtype = _resolve_best_subtype_impl(bits_per_sample)
 
         # 2. Write file with specified seekable format
         # format='WAV' is container, subtype determines encoding
-        sf.write(file_path, data, sample_rate, format="WAV", subtype=subtype)
+        AudioSeek._write_wav(file_path, data, sample_rate, subtype)
+
+        return Path(file_path)
+
+    @classmethod
+    def write_default_g726_16k_2bit(
+        cls, file_path: Path | str, data: np.ndarray
+    ) -> Path:
+        """
+        Specialized write() for contiguous float32 mono at 16 kHz, 2 bits.
+        Streams with fixed SoundFile arguments, skipping dtype preparation.
+        Uses the same seekable subtype write() resolves for 2 bits.
+        """
+        if data.dtype != np.float32 or data.ndim != 1 or not data.flags.c_contiguous:
+            raise ValueError(
+                "Expected contiguous 1-D float32 data, "
+                + f"got {data.dtype} with shape {data.shape}"
+            )
+
+        cls._write_blocks(file_path, data, 16000, 1, _resolve_best_subtype_impl(2))
 
         return Path(file_path)
 
@@ -132,23 +191,19 @@ class AudioSeek:
             bits (BITS_TYPE): Compression depth (2, 3, 4, 5)
             to_mono (bool): Whether to force conversion to mono
         """
-        import librosa
-
-        from audio_seek.ensure_mono import ensure_mono
-
-        # 1. Handle channels (Mono Mixing)
-        if to_mono:
+        # 1. Handle channels (Mono Mixing), skipped when already mono
+        if to_mono and data.ndim > 1:
             data = ensure_mono(data, style="librosa")
 
         # 2. Handle resampling (if source sr != target sr)
         if src_sr != target_sr:
-            # Use librosa's resample function
+            # soxr resampler (librosa fallback), float32 in/out
             # Note: This step is CPU intensive
-            data = librosa.resample(data, orig_sr=src_sr, target_sr=target_sr)
+            data = resample(data, src_sr, target_sr)
 
         # 3. Write file
-        subtype = AudioSeek.resolve_best_subtype(bits)
-        sf.write(output_path, data, target_sr, format="WAV", subtype=subtype)
+        subtype = _resolve_best_subtype_impl(bits)
+        AudioSeek._write_wav(output_path, data, target_sr, subtype)
 
         return Path(output_path)
 
@@ -172,24 +227,125 @@ class AudioSeek:
             bits (int): Compression depth (2=32kbps, 3=48kbps...)
             to_mono (bool): Whether to force conversion to mono
         """
-        import librosa
+        # 1. Decode with libsndfile (WAV/FLAC/OGG...), resample with soxr
+        try:
+            y, sr_native = sf.read(input_path, dtype="float32", always_2d=False)
 
-        if not os.path.exists(input_path):
-            raise FileNotFoundError(f"File not found: {input_path}")
+            if to_mono and y.ndim == 2:
+                y = ensure_mono(y, style="soundfile")
+            if sr_native != target_sr:
+                y = resample(y, sr_native, target_sr)
 
-        # 1. Load with librosa
-        try:
-            # y is audio data (float32), sr is actual sample rate read
-            y, _ = librosa.load(input_path, sr=target_sr, mono=to_mono)
-        except Exception as e:
-            raise RuntimeError(f"Failed to load or resample: {e}")
+        # Formats libsndfile can't decode (e.g. MP3 on older builds): use librosa
+        except sf.LibsndfileError as e:
+            if not os.path.exists(input_path):
+                raise FileNotFoundError(f"File not found: {input_path}") from e
+
+            import librosa
+
+            try:
+                # y is audio data (float32), sr is actual sample rate read
+                y, _ = librosa.load(input_path, sr=target_sr, mono=to_mono)
+            except Exception as e:
+                raise RuntimeError(f"Failed to load or resample: {e}")
 
         # 2. Write with best seekable format
-        subtype = AudioSeek.resolve_best_subtype(bits)
-        sf.write(output_path, y, target_sr, format="WAV", subtype=subtype)
+        subtype = _resolve_best_subtype_impl(bits)
+        AudioSeek._write_wav(output_path, y, target_sr, subtype)
 
         return output_path
 
+    @classmethod
+    def convert_many(
+        cls,
+        inputs: Iterable[Path | str],
+        output_dir: Path | str,
+        *,
+        target_sr: int = 16000,
+        bits: "BITS_TYPE" = 2,
+        to_mono: bool = True,
+        max_workers: int | None = None,
+    ) -> list[Path]:
+        """
+        Converts many audio files to G.726 WAV format in parallel.
+        Outputs are written to output_dir as <input stem>.wav.
+
+        Args:
+            inputs (Iterable[Path | str]): Source file paths
+            output_dir (Path | str): Output directory (created if missing)
+            target_sr (int): Target sample rate (default 16000)
+            bits (BITS_TYPE): Compression depth (2, 3, 4, 5)
+            to_mono (bool): Whether to force conversion to mono
+            max_workers (int | None): Thread count (default os.cpu_count())
+
+        Returns:
+            Output paths, in the same order as inputs
+        """
+        input_paths = [Path(p) for p in inputs]
+        output_dir = Path(output_dir)
+        output_paths = [output_dir / f"{p.stem}.wav" for p in input_paths]
+
+        if len(set(output_paths)) != len(output_paths):
+            raise ValueError("Input files must have unique stems")
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Resolve once up front so workers only hit the cache
+        _resolve_best_subtype_impl(bits)
+
+        # libsndfile and soxr release the GIL, threads are enough
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            futures = [
+                pool.submit(
+                    cls.convert_from_file,
+                    input_path,
+                    output_path,
+                    target_sr=target_sr,
+                    bits=bits,
+                    to_mono=to_mono,
+                )
+                for input_path, output_path in zip(input_paths, output_paths)
+            ]
+            for future in futures:
+                future.result()
+
+        return output_paths
+
+    @staticmethod
+    def _write_wav(
+        file_path: Path | str, data: np.ndarray, sample_rate: int, subtype: str
+    ) -> None:
+        """
+        Prepares data for libsndfile and streams it to a WAV file.
+        """
+        data = _prep_for_write(data)
+        channels = 1 if data.ndim == 1 else data.shape[1]
+
+        AudioSeek._write_blocks(file_path, data, sample_rate, channels, subtype)
+
+    @staticmethod
+    def _write_blocks(
+        file_path: Path | str,
+        data: np.ndarray,
+        sample_rate: int,
+        channels: int,
+        subtype: str,
+    ) -> None:
+        """
+        Streams data to a WAV file in WRITE_BLOCK_FRAMES chunks.
+        Keeps libsndfile's conversion buffer small and overlaps encode with I/O.
+        """
+        with sf.SoundFile(
+            file_path,
+            mode="w",
+            samplerate=sample_rate,
+            channels=channels,
+            format="WAV",
+            subtype=subtype,
+        ) as f:
+            for start in range(0, len(data), WRITE_BLOCK_FRAMES):
+                f.write(data[start : start + WRITE_BLOCK_FRAMES])
+
     @staticmethod
     def test_seekability(subtype: str, sample_rate: int = 16000) -> bool:
         """
@@ -238,70 +394,78 @@ class AudioSeek:
         Automatically downgrades to compatible format with warning if needed.
         Priority: Standard G726 -> IMA/MS ADPCM -> Fallback with warning
         """
-        # Check cache first
-        if bits in SUBTYPE_CACHE:
-            return SUBTYPE_CACHE[bits]["subtype"]
+        return _resolve_best_subtype_impl(bits)
+
 
-        # Get all available WAV subtypes on current system
-        available = sf.available_subtypes("WAV")
+@functools.lru_cache(maxsize=8)
+def _resolve_best_subtype_impl(bits: int) -> str:
+    """Memoized body of AudioSeek.resolve_best_subtype."""
+    global _AVAILABLE_WAV_SUBTYPES
 
-        # Define priority candidates for each bit depth
-        # Priority: Standard G.726 -> Known seekable formats
-        candidates_by_bits: dict[BITS_TYPE, list[str]] = {
-            2: ["G726_16", "NMS_ADPCM_16"],
-            3: ["G726_24", "NMS_ADPCM_24"],
-            4: ["G726_32", "G721_32", "IMA_ADPCM", "MS_ADPCM", "NMS_ADPCM_32"],
-            5: ["G726_40", "NMS_ADPCM_40"],
-        }
+    # Get all available WAV subtypes on current system (queried once)
+    if _AVAILABLE_WAV_SUBTYPES is None:
+        _AVAILABLE_WAV_SUBTYPES = frozenset(sf.available_subtypes("WAV"))
+    available = _AVAILABLE_WAV_SUBTYPES
 
-        candidates = candidates_by_bits.get(bits, [])
+    candidates = CANDIDATES_BY_BITS.get(bits, ())
 
-        # Find first available AND seekable format
-        selected_info: SubtypeInfo | None = None
+    # Find first available AND seekable format
+    selected_info: SubtypeInfo | None = None
 
-        for candidate in candidates:
-            if candidate not in available:
-                continue
+    for candidate in candidates:
+        if candidate not in available:
+            continue
 
-            # Test if this format supports seek
-            is_seekable = AudioSeek.test_seekability(candidate)
+        # Test if this format supports seek
+        is_seekable = AudioSeek.test_seekability(candidate)
 
-            if is_seekable:
+        if is_seekable:
+            selected_info = SubtypeInfo(
+                subtype=candidate,
+                seekable=True,
+                bits_per_sample=bits,
+            )
+            break
+
+    # Fallback strategy: if no seekable format found for requested bits
+    if selected_info is None:
+        warnings.warn(
+            f"No seekable {bits}-bit format available on this system. "
+            f"Falling back to 4-bit IMA_ADPCM for compatibility.",
+            UserWarning,
+            # Callers are AudioSeek methods, one frame below user code
+            stacklevel=3,
+        )
+
+        # Try standard fallback formats (widely supported and seekable)
+        for fallback in FALLBACK_CANDIDATES:
+            if fallback in available and AudioSeek.test_seekability(fallback):
                 selected_info = SubtypeInfo(
-                    subtype=candidate,
+                    subtype=fallback,
                     seekable=True,
-                    bits_per_sample=bits,
+                    bits_per_sample=4,  # These are typically 4-bit
                 )
                 break
 
-        # Fallback strategy: if no seekable format found for requested bits
-        if selected_info is None:
-            warnings.warn(
-                f"No seekable {bits}-bit format available on this system. "
-                f"Falling back to 4-bit IMA_ADPCM for compatibility.",
-                UserWarning,
-                stacklevel=2,
-            )
+    # Last resort: if even fallbacks don't work, raise error
+    if selected_info is None:
+        raise RuntimeError(
+            "Critical error: No seekable ADPCM format available on this system. "
+            "Please check your libsndfile installation."
+        )
+
+    # Record metadata (the subtype string itself is memoized by lru_cache)
+    SUBTYPE_CACHE[bits] = selected_info
+    return selected_info["subtype"]
 
-            # Try standard fallback formats (widely supported and seekable)
-            fallback_candidates = ["IMA_ADPCM", "MS_ADPCM"]
-
-            for fallback in fallback_candidates:
-                if fallback in available and AudioSeek.test_seekability(fallback):
-                    selected_info = SubtypeInfo(
-                        subtype=fallback,
-                        seekable=True,
-                        bits_per_sample=4,  # These are typically 4-bit
-                    )
-                    break
-
-        # Last resort: if even fallbacks don't work, raise error
-        if selected_info is None:
-            raise RuntimeError(
-                "Critical error: No seekable ADPCM format available on this system. "
-                "Please check your libsndfile installation."
-            )
 
-        # Cache the result
-        SUBTYPE_CACHE[bits] = selected_info
-        return selected_info["subtype"]
+def _prep_for_write(data: np.ndarray) -> np.ndarray:
+    """
+    Returns C-contiguous data in a dtype libsndfile consumes natively.
+    Floats become float32; int16/int32 are left as is (they're full-scale ints).
+    """
+    if data.dtype.kind == "f" and data.dtype != np.float32:
+        data = data.astype(np.float32)
+    if not data.flags.c_contiguous:
+        data = np.ascontiguousarray(data)
+    return data
@@ -0,0 +1,14 @@
+import numpy as np
+from numba import njit
+
+
+# Serial on purpose: parallel=True is not thread-safe under numba's default
+# workqueue layer, and this memory-bound loop gains little from threads
+@njit(fastmath=True, cache=True, boundscheck=False)
+def _i16_stereo_to_f32_mono(x: np.ndarray) -> np.ndarray:
+    """Fused int16 read, channel average and float32 write for (N, 2) input."""
+    n = x.shape[0]
+    out = np.empty(n, np.float32)
+    for i in range(n):
+        out[i] = (np.float32(x[i, 0]) + np.float32(x[i, 1])) * np.float32(0.5)
+    return out
@@ -4,13 +4,21 @@ import numpy as np
 
 
 def ensure_mono(
-    data: np.ndarray, *, style: Literal["librosa", "soundfile"] | None = None
+    data: np.ndarray,
+    *,
+    style: Literal["librosa", "soundfile"] | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Convert multi-channel audio to mono by averaging across channels.
     Supports librosa (channels, samples) and soundfile (samples, channels) formats.
+    Pass a float32 (samples,) buffer as `out` to reuse it instead of allocating.
     """
     if data.ndim == 1:
+        if out is not None:
+            _check_out(out, data.shape[0])
+            np.copyto(out, data)
+            return out
         return data
 
     elif data.ndim == 2:
@@ -18,18 +26,60 @@ def ensure_mono(
         # librosa typically produces (channels, samples),
         # soundfile uses (samples, channels)
         if style is None:
-            if data.shape[1] < data.shape[0]:  # Determine which dimension is channels
-                data = np.mean(data, axis=1)
-            else:
-                data = np.mean(data, axis=0)
+            # Determine which dimension is channels
+            axis = 1 if data.shape[1] < data.shape[0] else 0
         elif style == "librosa":
-            data = np.mean(data, axis=0)
+            axis = 0
         elif style == "soundfile":
-            data = np.mean(data, axis=1)
+            axis = 1
         else:
             raise ValueError(f"Unsupported style: {style}")
 
-        return data
+        if out is not None:
+            _check_out(out, data.shape[1 - axis])
+
+        return _downmix(data, axis, out)
 
     else:
         raise ValueError(f"Unsupported number of dimensions: {data.ndim}")
+
+
+def _check_out(out: np.ndarray, samples: int) -> None:
+    if out.dtype != np.float32 or out.shape != (samples,):
+        raise ValueError(
+            f"out must be float32 with shape ({samples},), "
+            + f"got {out.dtype} with shape {out.shape}"
+        )
+
+
+def _downmix(data: np.ndarray, axis: int, out: np.ndarray | None = None) -> np.ndarray:
+    """Average channels along `axis`, accumulating in float32 (no float64 temp)."""
+    channels = data.shape[axis]
+
+    if channels == 0:
+        raise ValueError(f"Cannot downmix data with no channels, shape {data.shape}")
+
+    # Already mono, e.g. (samples, 1) from some decoders: return a free view
+    if channels == 1:
+        view = data[0] if axis == 0 else data[:, 0]
+        if out is None:
+            return view
+        np.copyto(out, view)
+        return out
+
+    # Dominant phone-audio shape: int16 (samples, 2), single-pass JIT kernel
+    if out is None and data.dtype == np.int16 and axis == 1 and channels == 2:
+        from audio_seek._ensure_mono import _i16_stereo_to_f32_mono
+
+        return _i16_stereo_to_f32_mono(data)
+
+    # Stereo fast path: one fused add, then scale in place
+    if channels == 2:
+        left, right = (data[0], data[1]) if axis == 0 else (data[:, 0], data[:, 1])
+        out = np.add(left, right, dtype=np.float32, out=out)
+        out *= np.float32(0.5)
+        return out
+
+    out = np.sum(data, axis=axis, dtype=np.float32, out=out)
+    out *= np.float32(1.0 / channels)
+    return out
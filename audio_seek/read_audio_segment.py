@@ -1,3 +1,6 @@
+import functools
+import os
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -5,31 +8,64 @@ import soundfile as sf
 
 
 def read_audio_segment(
-    file_path: Path | str, start_sec: float, duration_sec: float
+    file_path: Path | str,
+    start_sec: float,
+    duration_sec: float,
+    *,
+    cached: bool = False,
 ) -> np.ndarray:
     """
     General reader: supports PCM WAV, G.726 WAV (32k/48k/64k...), FLAC, etc.
     If the soundfile library recognizes the header, it can seek accurately.
+    With cached=True, keeps the file open between calls (LRU of 16 handles)
+    so repeated seeks skip header parsing and decoder setup. Each cached read
+    still costs one os.stat() to detect a rewritten file.
     """
     try:
+        if cached:
+            f, lock = _open_cached(*_cache_key(file_path))
+            # A SoundFile handle has a single read position
+            with lock:
+                return _read_frames(f, start_sec, duration_sec)
+
         with sf.SoundFile(file_path) as f:
-            sr = f.samplerate  # Auto-detected, e.g., 16000
+            return _read_frames(f, start_sec, duration_sec)
+
+    except Exception as e:
+        raise ValueError(f"Read error: {e}")
 
-            # Compute frame (sample) positions
-            start_frame = int(start_sec * sr)
-            frames_to_read = int(duration_sec * sr)
 
-            # Check total length to avoid out-of-bounds reads (optional but safe)
-            if start_frame >= f.frames:
-                return np.array([], dtype=np.float32)
+def _read_frames(f: sf.SoundFile, start_sec: float, duration_sec: float) -> np.ndarray:
+    sr = f.samplerate  # Auto-detected, e.g., 16000
 
-            # Seek to the specified sample (O(1), very fast)
-            f.seek(start_frame)
+    # Compute frame (sample) positions
+    start_frame = int(start_sec * sr)
+    frames_to_read = int(duration_sec * sr)
 
-            # Read and decode automatically
-            data = f.read(frames_to_read, dtype="float32")
+    # Check total length to avoid out-of-bounds reads (optional but safe)
+    if start_frame >= f.frames:
+        return np.array([], dtype=np.float32)
 
-            return data
+    # Seek to the specified sample (O(1), very fast)
+    f.seek(start_frame)
 
-    except Exception as e:
-        raise ValueError(f"Read error: {e}")
+    # Read and decode automatically
+    data = f.read(frames_to_read, dtype="float32")
+
+    return data
+
+
+def _cache_key(file_path: Path | str) -> tuple[str, int, int]:
+    # mtime/size in the key so a rewritten file gets a fresh handle;
+    # abspath is string-only (realpath would lstat every path component)
+    path = os.path.abspath(file_path)
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=16)
+def _open_cached(
+    path: str, mtime_ns: int, size: int
+) -> tuple[sf.SoundFile, threading.Lock]:
+    # Evicted handles are closed when garbage collected
+    return sf.SoundFile(path), threading.Lock()
@@ -0,0 +1,27 @@
+import numpy as np
+
+try:
+    import soxr
+except ImportError:  # librosa fallback in resample()
+    soxr = None
+
+
+def resample(data: np.ndarray, src_sr: int, target_sr: int) -> np.ndarray:
+    """
+    Resample audio with soxr (C/SIMD polyphase FIR), falling back to librosa.
+    Multi-channel data must be soundfile layout (samples, channels).
+    """
+    if src_sr == target_sr:
+        return data
+
+    # soxr only takes its SIMD path for float32 input; int PCM is resampled
+    # natively (casting it unscaled to float would be out of range)
+    if data.dtype.kind == "f" and data.dtype != np.float32:
+        data = data.astype(np.float32)
+
+    if soxr is None:
+        import librosa
+
+        return librosa.resample(data, orig_sr=src_sr, target_sr=target_sr, axis=0)
+
+    return soxr.resample(data, src_sr, target_sr, quality="HQ")
@@ -1,6 +1,7 @@
 """Tests for audio conversion functionality."""
 
 import numpy as np
+import pytest
 
 from audio_seek import AudioSeek
 
@@ -71,6 +72,53 @@ class TestConversion:
         with sf.SoundFile(result_path) as f:
             assert f.channels == 1
 
+    def test_convert_int16_with_resampling(self, temp_dir):
+        """Test that int16 input is resampled without losing its scale."""
+        import soundfile as sf
+
+        t = np.arange(16000) / 16000
+        data = (12000 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+
+        output_path = temp_dir / "int16_resampled.wav"
+
+        AudioSeek.convert(
+            data=data,
+            output_path=output_path,
+            src_sr=16000,
+            target_sr=8000,
+            bits=4,
+        )
+
+        read_data, sr = sf.read(output_path, dtype="float32")
+        expected = 12000 / 32768 * np.sin(2 * np.pi * 440 * np.arange(8000) / 8000)
+
+        assert sr == 8000
+        mse = np.mean((read_data[:8000] - expected) ** 2)
+        assert mse < 0.01
+
+    def test_convert_stereo_with_resampling(self, temp_dir):
+        """Test resampling keeps channels when not mixing down to mono."""
+        stereo_data = np.random.randn(16000, 2).astype(np.float32) * 0.1
+
+        output_path = temp_dir / "stereo_resampled.wav"
+
+        result_path = AudioSeek.convert(
+            data=stereo_data,
+            output_path=output_path,
+            src_sr=16000,
+            target_sr=8000,
+            bits=4,
+            to_mono=False,
+        )
+
+        import soundfile as sf
+
+        with sf.SoundFile(result_path) as f:
+            assert f.samplerate == 8000
+            assert f.channels == 2
+            # ADPCM formats may add block padding, allow 50ms tolerance
+            assert abs(f.frames / f.samplerate - 1.0) < 0.05
+
     def test_convert_different_bit_depths(self, temp_dir, sample_audio_data):
         """Test conversion with different bit depths."""
         for bits in [2, 3, 4, 5]:
@@ -87,6 +135,55 @@ class TestConversion:
             assert result_path.exists()
             assert result_path.stat().st_size > 0
 
+    def test_convert_from_file(self, temp_dir):
+        """Test converting a stereo PCM WAV file with resampling."""
+        import soundfile as sf
+
+        input_path = temp_dir / "stereo_44k_input.wav"
+        stereo_data = np.random.randn(44100, 2).astype(np.float32) * 0.1
+        sf.write(input_path, stereo_data, 44100, format="WAV", subtype="PCM_16")
+
+        output_path = temp_dir / "converted_from_file.wav"
+
+        AudioSeek.convert_from_file(
+            input_path, output_path, target_sr=16000, bits=4, to_mono=True
+        )
+
+        with sf.SoundFile(output_path) as f:
+            assert f.samplerate == 16000
+            assert f.channels == 1
+            assert abs(f.frames / f.samplerate - 1.0) < 0.05
+
+    def test_convert_many(self, temp_dir):
+        """Test batch conversion of several files."""
+        import soundfile as sf
+
+        input_paths = []
+        for i, sr in enumerate([8000, 22050, 44100]):
+            input_path = temp_dir / f"batch_input_{i}.wav"
+            data = np.random.randn(sr // 2).astype(np.float32) * 0.1
+            sf.write(input_path, data, sr, format="WAV", subtype="PCM_16")
+            input_paths.append(input_path)
+
+        output_dir = temp_dir / "batch_output"
+
+        output_paths = AudioSeek.convert_many(
+            input_paths, output_dir, target_sr=16000, bits=4, max_workers=2
+        )
+
+        assert output_paths == [output_dir / p.name for p in input_paths]
+        for output_path in output_paths:
+            with sf.SoundFile(output_path) as f:
+                assert f.samplerate == 16000
+                assert abs(f.frames / f.samplerate - 0.5) < 0.05
+
+    def test_convert_from_nonexistent_file(self, temp_dir):
+        """Test that a missing input file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            AudioSeek.convert_from_file(
+                temp_dir / "missing_input.wav", temp_dir / "never_written.wav"
+            )
+
     def test_write_basic(self, temp_dir, sample_audio_data):
         """Test basic write operation."""
         output_path = temp_dir / "write_test.wav"
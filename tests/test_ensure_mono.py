@@ -0,0 +1,93 @@
+"""Tests for multi-channel to mono downmixing."""
+
+import numpy as np
+import pytest
+
+from audio_seek import ensure_mono
+
+
+class TestEnsureMono:
+    """Test suite for ensure_mono."""
+
+    def test_mono_passthrough(self, sample_audio_data):
+        """Test that 1-D data is returned unchanged."""
+        data = sample_audio_data["data"]
+        assert ensure_mono(data) is data
+
+    def test_single_channel_2d_is_view(self):
+        """Test that (samples, 1) input returns a view without copying."""
+        data = np.random.randn(1000, 1).astype(np.float32)
+
+        mono = ensure_mono(data)
+
+        assert mono.shape == (1000,)
+        assert np.shares_memory(mono, data)
+
+    def test_int16_stereo_float32_result(self):
+        """Test that int16 stereo is averaged in float32."""
+        data = np.random.randint(-32768, 32767, (1000, 2)).astype(np.int16)
+
+        mono = ensure_mono(data, style="soundfile")
+
+        assert mono.dtype == np.float32
+        assert mono.shape == (1000,)
+        np.testing.assert_allclose(mono, data.mean(axis=1), atol=1e-3)
+
+    def test_int16_stereo_from_threads(self):
+        """Test that the int16 stereo path is safe to call concurrently."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        data = np.random.randint(-32768, 32767, (200_000, 2)).astype(np.int16)
+        expected = data.mean(axis=1)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: ensure_mono(data, style="soundfile"), range(32))
+            )
+
+        for mono in results:
+            assert mono.dtype == np.float32
+            np.testing.assert_allclose(mono, expected, atol=1e-3)
+
+    def test_multichannel_styles(self):
+        """Test channel axis selection for each style."""
+        data = np.random.randn(3, 1000).astype(np.float32)
+
+        np.testing.assert_allclose(
+            ensure_mono(data, style="librosa"), data.mean(axis=0), atol=1e-6
+        )
+        np.testing.assert_allclose(ensure_mono(data), data.mean(axis=0), atol=1e-6)
+        np.testing.assert_allclose(
+            ensure_mono(data.T, style="soundfile"), data.mean(axis=0), atol=1e-6
+        )
+
+    def test_out_buffer_reused(self):
+        """Test that results are written into a caller-provided buffer."""
+        out = np.empty(1000, dtype=np.float32)
+
+        for channels in [1, 2, 3]:
+            data = np.random.randint(-1000, 1000, (1000, channels)).astype(np.int16)
+
+            mono = ensure_mono(data, style="soundfile", out=out)
+
+            assert mono is out
+            np.testing.assert_allclose(out, data.mean(axis=1), atol=1e-3)
+
+    def test_out_buffer_mismatch(self):
+        """Test that an out buffer of the wrong shape or dtype is rejected."""
+        data = np.zeros((1000, 2), dtype=np.float32)
+
+        with pytest.raises(ValueError):
+            ensure_mono(data, out=np.empty(999, dtype=np.float32))
+        with pytest.raises(ValueError):
+            ensure_mono(data, out=np.empty(1000, dtype=np.float64))
+
+    def test_no_channels(self):
+        """Test that a zero-length channel axis is rejected clearly."""
+        with pytest.raises(ValueError):
+            ensure_mono(np.zeros((0, 2), dtype=np.float32))
+
+    def test_invalid_style(self):
+        """Test that unknown styles are rejected."""
+        with pytest.raises(ValueError):
+            ensure_mono(np.zeros((10, 2)), style="unknown")  # type: ignore
@@ -111,6 +111,70 @@ class TestIO:
 
         assert read_data.dtype == np.float32
 
+    def test_write_float64_strided(self, temp_dir):
+        """Test that non-contiguous float64 input is written correctly."""
+        sample_rate = 16000
+        stereo = np.random.uniform(-0.5, 0.5, (sample_rate, 2))
+        data = stereo[:, 0]  # strided float64 view
+
+        output_path = temp_dir / "float64_strided.wav"
+
+        AudioSeek.write(
+            file_path=output_path,
+            data=data,
+            sample_rate=sample_rate,
+            bits_per_sample=4,
+        )
+
+        read_data = read_audio_segment(output_path, 0.0, 1.0)
+
+        assert len(read_data) == len(data)
+        assert np.mean((read_data - data) ** 2) < 0.01
+
+    def test_write_default_args_round_trip(self, temp_dir, sample_audio_data):
+        """Test write() with default args (specialized path) reads back."""
+        data = sample_audio_data["data"]
+
+        output_path = AudioSeek.write(temp_dir / "default_args.wav", data)
+        read_data = read_audio_segment(output_path, 0.0, 1.0)
+
+        assert AudioSeek.get_duration(output_path) >= 1.0
+        assert len(read_data) == len(data)
+        assert np.mean((read_data - data) ** 2) < 0.05
+
+        direct_path = AudioSeek.write_default_g726_16k_2bit(
+            temp_dir / "default_direct.wav", data
+        )
+        assert direct_path.read_bytes() == output_path.read_bytes()
+
+    def test_write_default_g726_16k_2bit_invalid(self, temp_dir, sample_audio_data):
+        """Test that the specialized write rejects non float32 mono input."""
+        data = sample_audio_data["data"]
+
+        for bad in [data.astype(np.float64), np.stack([data, data], axis=1)]:
+            with pytest.raises(ValueError):
+                AudioSeek.write_default_g726_16k_2bit(temp_dir / "bad.wav", bad)
+
+    @pytest.mark.parametrize("subtype", ["IMA_ADPCM", "MS_ADPCM", "PCM_16"])
+    @pytest.mark.parametrize("channels", [1, 2])
+    def test_blockwise_write_matches_sf_write(self, temp_dir, subtype, channels):
+        """Test multi-block streamed writes are byte-identical to sf.write."""
+        import soundfile as sf
+
+        from audio_seek._audio_seek import WRITE_BLOCK_FRAMES
+
+        frames = 3 * WRITE_BLOCK_FRAMES + 1
+        shape = (frames,) if channels == 1 else (frames, channels)
+        data = np.random.uniform(-0.5, 0.5, shape).astype(np.float32)
+
+        streamed_path = temp_dir / f"streamed_{subtype}_{channels}.wav"
+        reference_path = temp_dir / f"reference_{subtype}_{channels}.wav"
+
+        AudioSeek._write_wav(streamed_path, data, 16000, subtype)
+        sf.write(reference_path, data, 16000, format="WAV", subtype=subtype)
+
+        assert streamed_path.read_bytes() == reference_path.read_bytes()
+
     def test_value_range_preservation(self, temp_dir):
         """Test that audio value range is reasonably preserved."""
         sample_rate = 16000
@@ -75,6 +75,50 @@ class TestSeekability:
             segment = read_audio_segment(test_wav_file, start, duration)
             assert len(segment) > 0
 
+    def test_cached_reads_match_uncached(self, test_wav_file):
+        """Test that reads through a cached handle match fresh opens."""
+        positions = [(0.6, 0.1), (0.0, 0.2), (0.3, 0.1), (10.0, 0.1)]
+
+        for start, duration in positions:
+            cached = AudioSeek.read_segment(test_wav_file, start, duration, cached=True)
+            fresh = read_audio_segment(test_wav_file, start, duration)
+            np.testing.assert_array_equal(cached, fresh)
+
+    def test_cached_handle_reused(self, test_wav_file):
+        """Test that repeated cached reads reuse the same open handle."""
+        from audio_seek.read_audio_segment import _open_cached
+
+        _open_cached.cache_clear()
+
+        for start in [0.0, 0.3, 0.6, 0.2]:
+            read_audio_segment(test_wav_file, start, 0.1, cached=True)
+
+        info = _open_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 3
+
+    def test_cached_read_after_rewrite(self, temp_dir):
+        """Test that a rewritten file is reopened instead of read stale."""
+        import soundfile as sf
+
+        from audio_seek.read_audio_segment import _open_cached
+
+        path = temp_dir / "rewritten.wav"
+        sf.write(path, np.zeros(16000, dtype=np.float32), 16000, subtype="PCM_16")
+
+        old = read_audio_segment(path, 0.0, 0.5, cached=True)
+        assert np.all(old == 0)
+
+        # Different length, so the key changes even on coarse mtime clocks
+        sf.write(path, np.full(24000, 0.5, dtype=np.float32), 16000, subtype="PCM_16")
+        misses = _open_cached.cache_info().misses
+
+        new = read_audio_segment(path, 1.0, 0.5, cached=True)
+
+        assert _open_cached.cache_info().misses == misses + 1
+        assert len(new) == 8000
+        np.testing.assert_allclose(new, 0.5, atol=1e-3)
+
     def test_get_duration_accuracy(self, test_wav_file, sample_audio_data):
         """Test that get_duration returns accurate duration."""
         duration = AudioSeek.get_duration(test_wav_file)